@@ -8,6 +8,8 @@ of items to retrieve from a dataset for a given page and page size.
 from typing import Tuple
 import csv
 import math
+import threading
+from collections import OrderedDict
 from typing import List, Dict
 
 
@@ -32,9 +34,12 @@ class Server:
     """Server class to paginate a database of popular baby names.
     """
     DATA_FILE = "Popular_Baby_Names.csv"
+    HYPER_CACHE_SIZE = 1024
 
     def __init__(self):
         self.__dataset = None
+        self.__hyper_pages = OrderedDict()
+        self.__hyper_lock = threading.Lock()
 
     def dataset(self) -> List[List]:
         """Cached dataset
@@ -94,14 +99,33 @@ class Server:
                 - 'total_pages' (int): The total number of pages available in
                 the dataset.
 
+        The HYPER_CACHE_SIZE most recently used pages holding data are
+        cached, so repeated requests for the same page and page size are
+        answered without slicing the dataset again. Callers get their own
+        copy of the cached result.
+
         Raises:
             AssertionError: If `page` or `page_size` are not positive integers.
         """
+        assert isinstance(page, int) and page > 0
+        assert isinstance(page_size, int) and page_size > 0
+        key = (page, page_size)
+        with self.__hyper_lock:
+            hyper = self.__hyper_pages.get(key)
+            if hyper is not None:
+                self.__hyper_pages.move_to_end(key)
+                return dict(hyper, data=list(hyper['data']))
         data = self.get_page(page, page_size)
-        return {
+        hyper = {
             'page_size': len(data), 'page': page,
             'data': data,
             'next_page': page + 1 if len(data) == page_size else None,
             'prev_page': page - 1 if page != 1 else None,
             'total_pages': math.ceil(len(self.dataset()) / page_size)
         }
+        if data:
+            with self.__hyper_lock:
+                self.__hyper_pages[key] = dict(hyper, data=list(data))
+                if len(self.__hyper_pages) > self.HYPER_CACHE_SIZE:
+                    self.__hyper_pages.popitem(last=False)
+        return hyper
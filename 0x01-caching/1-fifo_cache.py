@@ -5,7 +5,7 @@ First-In-First-Out (FIFO) eviction policy. The FIFOCache inherits from
 BaseCaching and removes the oldest item when the cache reaches its max limit.
 """
 from base_caching import BaseCaching
-from collections import OrderedDict
+from collections import deque
 
 
 class FIFOCache(BaseCaching):
@@ -18,10 +18,11 @@ class FIFOCache(BaseCaching):
     def __init__(self):
         """
         Initialize the FIFOCache instance by calling the
-        superclass's initializer to set up cache_data.
+        superclass's initializer to set up cache_data, and a deque
+        of keys in insertion order.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
+        self.keys = deque()
 
     def put(self, key, item):
         """
@@ -38,9 +39,12 @@ class FIFOCache(BaseCaching):
         """
         if key is None or item is None:
             return
+        if key not in self.cache_data:
+            self.keys.append(key)
         self.cache_data[key] = item
         if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            first_key, _ = self.cache_data.popitem(False)
+            first_key = self.keys.popleft()
+            del self.cache_data[first_key]
             print("DISCARD:", first_key)
 
     def get(self, key):
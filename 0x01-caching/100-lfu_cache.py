@@ -3,8 +3,8 @@
 Least Frequently Used (LFU) caching module.
 """
 
-from collections import OrderedDict
 from base_caching import BaseCaching
+from cache_entries import Entry, EntryList, EntryTable
 
 
 class LFUCache(BaseCaching):
@@ -12,6 +12,7 @@ class LFUCache(BaseCaching):
     LFUCache class that inherits from BaseCaching.
     Implements a Least Frequently Used (LFU) caching policy, discarding
     the least frequently used entry when the cache exceeds the MAX_ITEMS limit.
+    Ties are broken by discarding the least recently used of those entries.
     """
 
     def __init__(self):
@@ -20,40 +21,48 @@ class LFUCache(BaseCaching):
         tracking.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
-        self.keys_freq = []  # Stores [key, frequency] pairs in insertion order
+        self.cache_data = EntryTable()
+        self.freq_lists = {}  # Maps a frequency to its EntryList, LRU first
+        self.min_freq = 0
 
-    def __reorder_items(self, mru_key):
+    def __link(self, entry):
         """
-        Reorder the items in cache based on access frequency.
-        Increments the frequency of the given key and repositions it in
-        the frequency list.
+        Append an entry to the list of its current frequency.
 
         Args:
-            mru_key: The key to update and reorder in the frequency list.
+            entry: The entry to link.
         """
-        max_positions = []
-        mru_freq = 0
-        mru_pos = 0
-        ins_pos = 0
-
-        for i, (key, freq) in enumerate(self.keys_freq):
-            if key == mru_key:
-                mru_freq = freq + 1
-                mru_pos = i
-                break
-            if not max_positions or freq < \
-                    self.keys_freq[max_positions[-1]][1]:
-                max_positions.append(i)
-
-        max_positions.reverse()
-        for pos in max_positions:
-            if self.keys_freq[pos][1] > mru_freq:
-                break
-            ins_pos = pos
-
-        self.keys_freq.pop(mru_pos)
-        self.keys_freq.insert(ins_pos, [mru_key, mru_freq])
+        entries = self.freq_lists.get(entry.freq)
+        if entries is None:
+            entries = self.freq_lists[entry.freq] = EntryList()
+        entries.append(entry)
+
+    def __unlink(self, entry):
+        """
+        Remove an entry from the list of its current frequency, dropping
+        the list once it is empty.
+
+        Args:
+            entry: The entry to unlink.
+        """
+        entries = self.freq_lists[entry.freq]
+        entries.remove(entry)
+        if not entries:
+            del self.freq_lists[entry.freq]
+
+    def __touch(self, entry):
+        """
+        Increment the frequency of an entry and move it to the most
+        recently used end of its new frequency list.
+
+        Args:
+            entry: The entry that was accessed.
+        """
+        self.__unlink(entry)
+        if entry.freq == self.min_freq and entry.freq not in self.freq_lists:
+            self.min_freq += 1
+        entry.freq += 1
+        self.__link(entry)
 
     def put(self, key, item):
         """
@@ -70,18 +79,20 @@ class LFUCache(BaseCaching):
         """
         if key is None or item is None:
             return
-        if key not in self.cache_data:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                lfu_key, _ = self.keys_freq.pop()
-                self.cache_data.pop(lfu_key)
-                print("DISCARD:", lfu_key)
-            self.cache_data[key] = item
-            ins_index = next((i for i, (_, freq) in enumerate(self.keys_freq)
-                              if freq == 0), len(self.keys_freq))
-            self.keys_freq.insert(ins_index, [key, 0])
-        else:
-            self.cache_data[key] = item
-            self.__reorder_items(key)
+        entry = self.cache_data.entry(key)
+        if entry is not None:
+            entry.value = item
+            self.__touch(entry)
+            return
+        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
+            lfu = self.freq_lists[self.min_freq].first()
+            self.__unlink(lfu)
+            self.cache_data.remove(lfu.key)
+            print("DISCARD:", lfu.key)
+        entry = Entry(key, item)
+        self.cache_data.add(entry)
+        self.__link(entry)
+        self.min_freq = 0
 
     def get(self, key):
         """
@@ -94,6 +105,8 @@ class LFUCache(BaseCaching):
             The value associated with the specified key, or None if the key
             is not in the cache.
         """
-        if key is not None and key in self.cache_data:
-            self.__reorder_items(key)
-        return self.cache_data.get(key, None)
+        entry = self.cache_data.entry(key)
+        if entry is None:
+            return None
+        self.__touch(entry)
+        return entry.value
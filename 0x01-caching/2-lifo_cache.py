@@ -6,7 +6,6 @@ BaseCaching and removes the most recently added item when the cache
 exceeds its max capacity.
 """
 
-from collections import OrderedDict
 from base_caching import BaseCaching
 
 
@@ -19,11 +18,11 @@ class LIFOCache(BaseCaching):
 
     def __init__(self):
         """
-        Initialize the LIFOCache instance, setting up an
-        OrderedDict for cache_data to maintain item order.
+        Initialize the LIFOCache instance. cache_data is a plain dict,
+        whose insertion order already puts the most recently added entry
+        last, so no extra per-key bookkeeping is needed.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
 
     def put(self, key, item):
         """
@@ -40,12 +39,12 @@ class LIFOCache(BaseCaching):
         """
         if key is None or item is None:
             return
-        if key not in self.cache_data:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                last_key, _ = self.cache_data.popitem(last=True)
-                print("DISCARD:", last_key)
+        if key in self.cache_data:
+            del self.cache_data[key]
+        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
+            last_key, _ = self.cache_data.popitem()
+            print("DISCARD:", last_key)
         self.cache_data[key] = item
-        self.cache_data.move_to_end(key, last=True)
 
     def get(self, key):
         """
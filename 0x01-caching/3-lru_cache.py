@@ -3,6 +3,7 @@
                  and is a caching system
 '''
 
+from collections import OrderedDict
 BaseCaching = __import__('base_caching').BaseCaching
 
 
@@ -18,9 +19,11 @@ class LRUCache(BaseCaching):
           get - method that retrieves a key/value pair from cache '''
 
     def __init__(self):
-        ''' Initialize class instance. '''
+        ''' Initialize class instance.
+            cache_data is an OrderedDict kept in access order, least
+            recently used entry first, so every update is O(1). '''
         super().__init__()
-        self.keys = []
+        self.cache_data = OrderedDict()
 
     def put(self, key, item):
         ''' Add key/value pair to cache data.
@@ -29,19 +32,15 @@ class LRUCache(BaseCaching):
             entry. '''
         if key is not None and item is not None:
             self.cache_data[key] = item
-            if key not in self.keys:
-                self.keys.append(key)
-            else:
-                self.keys.append(self.keys.pop(self.keys.index(key)))
-            if len(self.keys) > BaseCaching.MAX_ITEMS:
-                discard = self.keys.pop(0)
-                del self.cache_data[discard]
+            self.cache_data.move_to_end(key)
+            if len(self.cache_data) > BaseCaching.MAX_ITEMS:
+                discard, _ = self.cache_data.popitem(last=False)
                 print('DISCARD: {:s}'.format(discard))
 
     def get(self, key):
         ''' Return value stored in `key` key of cache.
             If key is None or does not exist in cache, return None. '''
         if key is not None and key in self.cache_data:
-            self.keys.append(self.keys.pop(self.keys.index(key)))
+            self.cache_data.move_to_end(key)
             return self.cache_data[key]
         return None
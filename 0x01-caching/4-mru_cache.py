@@ -6,7 +6,6 @@ BaseCaching and removes the most recently accessed item when the
 cache exceeds its maximum capacity.
 """
 
-from collections import OrderedDict
 from base_caching import BaseCaching
 
 
@@ -20,11 +19,11 @@ class MRUCache(BaseCaching):
 
     def __init__(self):
         """
-        Initialize the MRUCache instance and set up an OrderedDict
-        for cache_data to track the order of item access.
+        Initialize the MRUCache instance. cache_data is a plain dict
+        kept in access order by reinserting accessed keys, so the most
+        recently used entry is always last.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
 
     def put(self, key, item):
         """
@@ -41,14 +40,12 @@ class MRUCache(BaseCaching):
         """
         if key is None or item is None:
             return
-        if key not in self.cache_data:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                mru_key, _ = self.cache_data.popitem(last=True)
-                print("DISCARD:", mru_key)
-            self.cache_data[key] = item
-        else:
-            self.cache_data[key] = item
-        self.cache_data.move_to_end(key, last=True)
+        if key in self.cache_data:
+            del self.cache_data[key]
+        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
+            mru_key, _ = self.cache_data.popitem()
+            print("DISCARD:", mru_key)
+        self.cache_data[key] = item
 
     def get(self, key):
         """
@@ -62,6 +59,8 @@ class MRUCache(BaseCaching):
             The value associated with the specified key, or None
             if the key is not in the cache.
         """
-        if key is not None and key in self.cache_data:
-            self.cache_data.move_to_end(key, last=True)
-        return self.cache_data.get(key, None)
+        if key is None or key not in self.cache_data:
+            return None
+        item = self.cache_data.pop(key)
+        self.cache_data[key] = item
+        return item
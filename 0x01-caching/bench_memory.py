@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+This module measures the memory used per cached entry by each caching
+policy once it holds 10^6 keys. Run it from this directory:
+
+    ./bench_memory.py [number_of_keys]
+"""
+import gc
+import sys
+import tracemalloc
+from base_caching import BaseCaching
+
+POLICIES = [
+    ('0-basic_cache', 'BasicCache'),
+    ('1-fifo_cache', 'FIFOCache'),
+    ('2-lifo_cache', 'LIFOCache'),
+    ('3-lru_cache', 'LRUCache'),
+    ('4-mru_cache', 'MRUCache'),
+    ('100-lfu_cache', 'LFUCache'),
+]
+
+
+def bytes_per_entry(cache_class, keys):
+    """
+    Fill a new cache with every key and return the bytes it allocated
+    per entry. Keys and values are allocated beforehand so only the
+    cache's own bookkeeping is measured.
+
+    Args:
+        cache_class: The caching policy to measure.
+        keys (list): The keys to insert; each key is also its value.
+
+    Returns:
+        float: The number of bytes allocated per entry.
+    """
+    gc.collect()
+    tracemalloc.start()
+    cache = cache_class()
+    for key in keys:
+        cache.put(key, key)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return used / len(keys)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    BaseCaching.MAX_ITEMS = size
+    keys = [str(i) for i in range(size)]
+    for module, name in POLICIES:
+        cache_class = getattr(__import__(module), name)
+        print("{}: {:.1f} bytes/entry".format(
+            name, bytes_per_entry(cache_class, keys)))
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+This module provides the compact entry storage used by LFUCache. Every
+cached key lives in a single Entry record that holds its key, value,
+access frequency and list links, in place of a separate [key, frequency]
+list per key.
+
+Only LFUCache uses it: an Entry costs about 103 bytes per key (dict slot
+included), which is cheaper than LFU's former containers (about 160) but
+dearer than what the other policies need. LIFO and MRU keep a plain
+insertion-ordered dict (about 31 bytes) and FIFO a dict plus a deque of
+keys (about 39 bytes), as they only touch the ends of their order. LRU
+must move any key to the end on every hit, so it keeps an OrderedDict
+(about 80 bytes): more than a dict plus a key list (about 39), which
+needs an O(n) scan per hit, but less than an Entry, with the same O(1)
+move_to_end and popitem.
+"""
+from collections.abc import Mapping
+
+
+class Entry:
+    """
+    A single cache entry.
+
+    Attributes:
+        key: The key under which the item is stored.
+        value: The stored item.
+        freq (int): Number of accesses since insertion (used by LFU).
+        prev (Entry): The previous entry in the owning EntryList.
+        next (Entry): The next entry in the owning EntryList.
+    """
+    __slots__ = ('key', 'value', 'freq', 'prev', 'next')
+
+    def __init__(self, key=None, value=None):
+        """
+        Initialize an unlinked entry with a zero access frequency.
+
+        Args:
+            key: The key under which the item is stored.
+            value: The item to store.
+        """
+        self.key = key
+        self.value = value
+        self.freq = 0
+        self.prev = self
+        self.next = self
+
+
+class EntryList:
+    """
+    Circular doubly-linked list of Entry records around a sentinel.
+    The entry after the sentinel is the first (oldest) one and the entry
+    before it is the last (newest) one. All operations are O(1).
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self):
+        """
+        Initialize an empty list.
+        """
+        self.root = Entry()
+        self.size = 0
+
+    def __len__(self):
+        """
+        Return the number of entries in the list.
+        """
+        return self.size
+
+    def append(self, entry):
+        """
+        Link an entry at the end of the list.
+
+        Args:
+            entry (Entry): The entry to link.
+        """
+        last = self.root.prev
+        entry.prev = last
+        entry.next = self.root
+        last.next = entry
+        self.root.prev = entry
+        self.size += 1
+
+    def remove(self, entry):
+        """
+        Unlink an entry from the list.
+
+        Args:
+            entry (Entry): The entry to unlink; it must be in this list.
+        """
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = entry
+        self.size -= 1
+
+    def first(self):
+        """
+        Return the first entry, or None if the list is empty.
+        """
+        return self.root.next if self.size else None
+
+
+class EntryTable(Mapping):
+    """
+    Read-only mapping from keys to stored values, backed by a private
+    dictionary of Entry records. It can be used as cache_data by
+    BaseCaching.print_cache and callers alike without exposing the
+    records, which policies reach through entry(), add() and remove().
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty table.
+        """
+        self.__entries = {}
+
+    def entry(self, key):
+        """
+        Return the Entry stored under key, or None if there is none.
+        """
+        return self.__entries.get(key)
+
+    def add(self, entry):
+        """
+        Store an entry under its key.
+        """
+        self.__entries[entry.key] = entry
+
+    def remove(self, key):
+        """
+        Remove the entry stored under key.
+        """
+        del self.__entries[key]
+
+    def __getitem__(self, key):
+        """
+        Return the value stored under key.
+        """
+        return self.__entries[key].value
+
+    def __contains__(self, key):
+        """
+        Return whether an entry is stored under key.
+        """
+        return key in self.__entries
+
+    def __iter__(self):
+        """
+        Iterate over the stored keys.
+        """
+        return iter(self.__entries)
+
+    def __len__(self):
+        """
+        Return the number of stored entries.
+        """
+        return len(self.__entries)
+
+    def __repr__(self):
+        """
+        Return the representation of the equivalent key/value dict.
+        """
+        return repr(dict(self.items()))
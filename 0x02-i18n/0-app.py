@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """
 This module starts a simple Flask web application that renders an HTML file.
+The rendered page is served through PageCache, so repeat requests skip
+template rendering and can be answered with 304 Not Modified.
 """
 from flask import Flask, render_template
+from page_cache import PageCache
 
 app = Flask(__name__)
+page_cache = PageCache(app)
 
 @app.route('/')
+@page_cache.cached('0-index.html')
 def home():
     """
     Renders the home page of the web application.
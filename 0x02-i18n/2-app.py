@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+This module starts a Flask web application with Babel that selects the
+best supported locale from the request's Accept-Language header.
+
+Header values repeat heavily between requests, so the header to locale
+negotiation is memoized in a bounded cache. When PRELOAD_CATALOGS is set,
+every supported translation catalog is compiled and loaded once at startup
+into Flask-Babel's translation cache, so no catalog I/O happens while
+serving a request.
+"""
+import os
+from functools import lru_cache
+from typing import Callable, List
+
+from babel.messages.mofile import write_mo
+from babel.messages.pofile import read_po
+from babel.support import Translations
+from flask import Flask, render_template, request
+from flask_babel import Babel
+from page_cache import PageCache
+from werkzeug.datastructures import LanguageAccept
+from werkzeug.http import parse_accept_header
+
+app = Flask(__name__)
+babel = Babel(app)
+page_cache = PageCache(app)
+
+
+class Config:
+    """
+    Configuration class for setting up application variables.
+
+    Attributes:
+        LANGUAGES (list): Supported languages for the application.
+        BABEL_DEFAULT_LOCALE (str): Locale used when no language matches.
+        BABEL_DEFAULT_TIMEZONE (str): Default timezone for the application.
+        LOCALE_CACHE_SIZE (int): Number of distinct Accept-Language
+            headers whose best match is remembered.
+        PRELOAD_CATALOGS (bool): Whether to compile and load every
+            supported catalog at startup.
+    """
+    LANGUAGES = ["en", "fr"]
+    BABEL_DEFAULT_LOCALE = "en"
+    BABEL_DEFAULT_TIMEZONE = "UTC"
+    LOCALE_CACHE_SIZE = 1024
+    PRELOAD_CATALOGS = True
+
+
+app.config.from_object(Config)
+
+best_locale: Callable[[str], str]
+
+
+def locale_matcher(languages: List[str], default: str,
+                   cache_size: int) -> Callable[[str], str]:
+    """
+    Build a memoized negotiation of Accept-Language headers.
+
+    Args:
+        languages (List[str]): Supported languages, in preference order.
+        default (str): Locale returned when no language is accepted.
+        cache_size (int): Number of distinct headers remembered.
+
+    Returns:
+        Callable[[str], str]: Maps a raw Accept-Language header to the
+                              best matching supported language.
+    """
+    languages = list(languages)
+
+    @lru_cache(maxsize=cache_size)
+    def best_match(accept_language: str) -> str:
+        """
+        Negotiate the best supported locale for an Accept-Language header.
+        """
+        accepted = parse_accept_header(accept_language, LanguageAccept)
+        return accepted.best_match(languages, default=default)
+    return best_match
+
+
+def compile_catalog(dirname: str, locale: str) -> None:
+    """
+    Compile the locale's messages.po into messages.mo when the compiled
+    catalog is missing or older than its source.
+
+    Args:
+        dirname (str): The translation directory holding the locale.
+        locale (str): The locale whose catalog is compiled.
+    """
+    base = os.path.join(dirname, locale, 'LC_MESSAGES', 'messages')
+    po_path, mo_path = base + '.po', base + '.mo'
+    if not os.path.exists(po_path):
+        return
+    if os.path.exists(mo_path) and \
+            os.path.getmtime(mo_path) >= os.path.getmtime(po_path):
+        return
+    with open(po_path, 'rb') as po_file:
+        catalog = read_po(po_file, locale=locale)
+    with open(mo_path, 'wb') as mo_file:
+        write_mo(mo_file, catalog)
+
+
+def preload_catalogs() -> None:
+    """
+    Compile and load the translation catalog of every supported language
+    into Flask-Babel's translation cache, which it would otherwise fill
+    from disk on the first request for each locale.
+    """
+    domain = babel.domain_instance
+    for locale in app.config['LANGUAGES']:
+        translations = Translations()
+        for dirname in babel.translation_directories:
+            compile_catalog(dirname, locale)
+            catalog = Translations.load(dirname, [locale], babel.domain)
+            translations.merge(catalog)
+            if hasattr(catalog, 'plural'):
+                translations.plural = catalog.plural
+        domain.cache[(locale, babel.domain)] = translations
+
+
+def init_locales() -> None:
+    """
+    Set up locale selection from app.config: build best_locale from
+    LANGUAGES, BABEL_DEFAULT_LOCALE and LOCALE_CACHE_SIZE, and preload
+    the catalogs when PRELOAD_CATALOGS is set. Runs at import; call it
+    again after changing any of these settings.
+    """
+    global best_locale
+    best_locale = locale_matcher(app.config['LANGUAGES'],
+                                 app.config['BABEL_DEFAULT_LOCALE'],
+                                 app.config['LOCALE_CACHE_SIZE'])
+    if app.config['PRELOAD_CATALOGS']:
+        preload_catalogs()
+
+
+@babel.localeselector
+def get_locale() -> str:
+    """
+    Select the locale for the current request from its Accept-Language
+    header.
+
+    Returns:
+        str: The best matching supported language.
+    """
+    return best_locale(request.headers.get('Accept-Language', ''))
+
+
+@app.route('/')
+@page_cache.cached('2-index.html', locale=get_locale)
+def home() -> str:
+    """
+    Renders the home page of the web application.
+
+    Returns:
+        The rendered HTML page '2-index.html' as a response to the client.
+    """
+    return render_template('2-index.html')
+
+
+init_locales()
+
+if __name__ == "__main__":
+    """
+    Run the Flask application in debug mode when this script is executed
+    directly.
+    """
+    app.run(debug=True)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+This module provides PageCache, an optional response cache for Flask views
+that render a single template. Rendered bodies are kept per (route,
+locale) together with the template's modification time, served with a
+strong ETag, answered with 304 Not Modified when the client already holds
+them and, optionally, stored with a precompressed gzip variant.
+"""
+import gzip
+import hashlib
+import os
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Flask, Response, request
+
+
+class CachedPage:
+    """
+    A rendered page and its precomputed representations.
+
+    Attributes:
+        mtime (float): Modification time of the template it was rendered
+            from.
+        body (bytes): The UTF-8 encoded page.
+        etag (str): Strong ETag of body.
+        gzip_body (bytes): The gzip compressed page, or None.
+        gzip_etag (str): Strong ETag of gzip_body, or None.
+    """
+    __slots__ = ('mtime', 'body', 'etag', 'gzip_body', 'gzip_etag')
+
+    def __init__(self, html: str, mtime: float, gzip_level: int = 0):
+        """
+        Encode a rendered page and compute its ETags.
+
+        Args:
+            html (str): The rendered page.
+            mtime (float): Modification time of the source template.
+            gzip_level (int): Compression level of the gzip variant, or 0
+                to store no gzip variant.
+        """
+        self.mtime = mtime
+        self.body = html.encode('utf-8')
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.gzip_body = None
+        self.gzip_etag = None
+        if gzip_level:
+            self.gzip_body = gzip.compress(self.body, gzip_level, mtime=0)
+            self.gzip_etag = self.etag + '-gzip'
+
+
+class PageCache:
+    """
+    Response cache for template rendering views.
+
+    The cache is configured through the application's config:
+        PAGE_CACHE_ENABLED (bool): Serve views from the cache (default
+            True).
+        PAGE_CACHE_GZIP_LEVEL (int): Compression level of the stored gzip
+            variants, or 0 to store none (default 0).
+    """
+
+    def __init__(self, app: Flask):
+        """
+        Initialize an empty cache for the given application.
+
+        Args:
+            app (Flask): The application whose views are cached.
+        """
+        self.app = app
+        self.pages: Dict[Tuple[str, Optional[str]], CachedPage] = {}
+        app.config.setdefault('PAGE_CACHE_ENABLED', True)
+        app.config.setdefault('PAGE_CACHE_GZIP_LEVEL', 0)
+
+    def template_mtime(self, template_name: str) -> float:
+        """
+        Return the modification time of a template.
+
+        Args:
+            template_name (str): The name of the template.
+
+        Returns:
+            float: The template's modification time.
+        """
+        template = self.app.jinja_env.get_template(template_name)
+        return os.path.getmtime(template.filename)
+
+    def cached(self, template_name: str,
+               locale: Optional[Callable[[], str]] = None) -> Callable:
+        """
+        Cache the body returned by a view rendering template_name.
+
+        Args:
+            template_name (str): The template the view renders.
+            locale (callable): Returns the locale of the current request,
+                when the page depends on it.
+
+        Returns:
+            Callable: A decorator for the view.
+        """
+        def decorator(view: Callable) -> Callable:
+            """
+            Wrap view so its rendered body is served from the cache.
+            """
+            @wraps(view)
+            def wrapper(*args, **kwargs) -> Response:
+                """
+                Serve the cached page, rendering it on a miss or when its
+                template has changed.
+                """
+                if not self.app.config['PAGE_CACHE_ENABLED']:
+                    return view(*args, **kwargs)
+                key = (request.path, locale() if locale else None)
+                mtime = self.template_mtime(template_name)
+                page = self.pages.get(key)
+                if page is None or page.mtime != mtime:
+                    page = CachedPage(view(*args, **kwargs), mtime,
+                                      self.app.config['PAGE_CACHE_GZIP_LEVEL'])
+                    self.pages[key] = page
+                return self.respond(page, vary_locale=locale is not None)
+            return wrapper
+        return decorator
+
+    def respond(self, page: CachedPage, vary_locale: bool) -> Response:
+        """
+        Build the response for a cached page, picking the gzip variant
+        when the client accepts it with a non-zero q-value, and answering
+        304 when the client's If-None-Match names the chosen representation
+        (weak comparison, as RFC 7232 requires for If-None-Match).
+
+        Args:
+            page (CachedPage): The page to serve.
+            vary_locale (bool): Whether the page depends on the
+                Accept-Language header.
+
+        Returns:
+            Response: The response to send.
+        """
+        body, etag = page.body, page.etag
+        use_gzip = page.gzip_body is not None and \
+            request.accept_encodings['gzip'] > 0
+        if use_gzip:
+            body, etag = page.gzip_body, page.gzip_etag
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='text/html')
+            if use_gzip:
+                response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag)
+        if page.gzip_body is not None:
+            response.vary.add('Accept-Encoding')
+        if vary_locale:
+            response.vary.add('Accept-Language')
+        return response
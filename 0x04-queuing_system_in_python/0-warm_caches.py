@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+This module warms the pagination and i18n caches after a deploy. The
+caches live in process memory, so start_warm_up() is meant to be called
+by the serving process at boot: it runs warm-up jobs on a background
+JobQueue against that process's own Server and Flask application:
+    - warm_hyper_pages precomputes the popular get_hyper pages of a page
+      size on a pagination Server;
+    - warm_locale_pages renders pages once per supported locale through
+      a Flask application, filling its PageCache.
+"""
+import os
+import sys
+from typing import Iterable
+
+from job_queue import Job, JobQueue, SQLiteBroker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGINATION_DIR = os.path.join(ROOT, '0x00-pagination')
+I18N_DIR = os.path.join(ROOT, '0x02-i18n')
+
+POPULAR_PAGE_SIZES = [10, 20, 50]
+POPULAR_PAGES = 10
+LOCALE_PATHS = ['/']
+# Broker database; the default keeps jobs in memory for this run only
+BROKER_DB = os.environ.get('WARM_CACHES_DB', ':memory:')
+
+
+def warm_hyper_pages(server, job: Job) -> None:
+    """
+    Precompute the first pages of one page size on a pagination server.
+
+    Args:
+        server: The Server whose get_hyper pages are cached.
+        job (Job): The job; data holds 'page_size' and 'pages'.
+    """
+    page_size, pages = job.data['page_size'], job.data['pages']
+    for page in range(1, pages + 1):
+        if server.get_hyper(page, page_size)['next_page'] is None:
+            break
+        job.report_progress(page, pages)
+
+
+def warm_locale_pages(app, job: Job) -> None:
+    """
+    Request pages once per supported locale so their rendered bodies are
+    cached.
+
+    Args:
+        app: The Flask application serving the pages.
+        job (Job): The job; data holds the 'paths' to render.
+    """
+    paths = job.data['paths']
+    locales = app.config['LANGUAGES']
+    client = app.test_client()
+    total, done = len(paths) * len(locales), 0
+    for path in paths:
+        for locale in locales:
+            response = client.get(path, headers={'Accept-Language': locale})
+            if response.status_code != 200:
+                raise RuntimeError("GET {} ({}) returned {}".format(
+                    path, locale, response.status_code))
+            done += 1
+            job.report_progress(done, total)
+
+
+def start_warm_up(server, app, broker: SQLiteBroker,
+                  page_sizes: Iterable[int] = POPULAR_PAGE_SIZES,
+                  pages: int = POPULAR_PAGES,
+                  paths: Iterable[str] = LOCALE_PATHS,
+                  concurrency: int = 2, attempts: int = 3) -> JobQueue:
+    """
+    Queue one pagination job per page size and one i18n job, and start
+    processing them in background threads of the calling process.
+
+    Args:
+        server: The pagination Server this process serves.
+        app: The Flask application this process serves.
+        broker (SQLiteBroker): Where the jobs are stored.
+        page_sizes (Iterable[int]): Page sizes to warm.
+        pages (int): Number of leading pages to warm per page size.
+        paths (Iterable[str]): Paths of the i18n app to render.
+        concurrency (int): Maximum number of jobs run at once.
+        attempts (int): Number of times each job may be started.
+
+    Returns:
+        JobQueue: The running queue; join() it to wait for the warm-up.
+    """
+    queue = JobQueue(broker, concurrency)
+    queue.register('warm_hyper_pages',
+                   lambda job: warm_hyper_pages(server, job))
+    queue.register('warm_locale_pages',
+                   lambda job: warm_locale_pages(app, job))
+    for page_size in page_sizes:
+        queue.enqueue('warm_hyper_pages',
+                      {'page_size': page_size, 'pages': pages}, attempts)
+    queue.enqueue('warm_locale_pages', {'paths': list(paths)}, attempts)
+    queue.start(until_empty=True)
+    return queue
+
+
+if __name__ == "__main__":
+    """
+    Serve the i18n application from this process after starting the
+    warm-up of its caches and of the pagination server it holds. Jobs
+    are kept in memory unless WARM_CACHES_DB names a database file.
+    """
+    broker = SQLiteBroker(BROKER_DB)
+    sys.path[:0] = [PAGINATION_DIR, I18N_DIR]
+    os.chdir(PAGINATION_DIR)
+    server = __import__('2-hypermedia_pagination').Server()
+    app = __import__('2-app').app
+
+    start_warm_up(server, app, broker)
+    app.run()
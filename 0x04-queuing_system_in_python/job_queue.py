@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+This module provides a small job queue: a SQLite table acting as the
+broker and an in-process pool of worker threads that process the queued
+jobs with bounded concurrency. Jobs report their progress to the broker
+and are retried until they run out of attempts.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = 'queued'
+ACTIVE = 'active'
+COMPLETE = 'complete'
+FAILED = 'failed'
+
+
+def process_alive(pid: int) -> bool:
+    """
+    Return whether a process with the given id is running on this host.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # running, but owned by another user
+    return True
+
+
+class Job:
+    """
+    A job claimed from the broker.
+
+    Attributes:
+        id (int): The job's identifier in the broker.
+        name (str): The name of the handler that processes the job.
+        data (dict): The JSON serializable arguments of the job.
+        status (str): One of queued, active, complete or failed.
+        attempts (int): Number of times the job has been started.
+        max_attempts (int): Number of times the job may be started.
+        progress (int): Completion percentage reported by the handler.
+        error (str): Traceback of the last failed attempt, or None.
+    """
+    __slots__ = ('broker', 'id', 'name', 'data', 'status', 'attempts',
+                 'max_attempts', 'progress', 'error')
+
+    def __init__(self, broker: 'SQLiteBroker', row: sqlite3.Row):
+        """
+        Initialize a job from a row of the broker's jobs table.
+
+        Args:
+            broker (SQLiteBroker): The broker holding the job.
+            row (sqlite3.Row): The job's row.
+        """
+        self.broker = broker
+        self.id = row['id']
+        self.name = row['name']
+        self.data = json.loads(row['data'])
+        self.status = row['status']
+        self.attempts = row['attempts']
+        self.max_attempts = row['max_attempts']
+        self.progress = row['progress']
+        self.error = row['error']
+
+    def report_progress(self, done: int, total: int) -> None:
+        """
+        Record how much of the job is done. Progress is informational,
+        so an update the locked database refuses is skipped rather than
+        failing the job.
+
+        Args:
+            done (int): Units of work completed so far.
+            total (int): Total units of work.
+        """
+        self.progress = 100 * done // total if total else 100
+        try:
+            self.broker.set_progress(self.id, self.progress)
+        except sqlite3.OperationalError:
+            pass
+
+
+class SQLiteBroker:
+    """
+    Job broker storing jobs in a SQLite database, either an in-memory
+    database shared by the threads of this process or a local file that
+    processes on the same host may share. Each active job records the
+    process id of its owner, so a process only takes back jobs whose
+    owner has died.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open the database, create the jobs table if needed and queue
+        again the jobs whose owning process is gone.
+
+        Args:
+            path (str): Path of the database file, or ':memory:'.
+        """
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False,
+                                  isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' name TEXT NOT NULL,'
+            ' data TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' max_attempts INTEGER NOT NULL,'
+            ' progress INTEGER NOT NULL DEFAULT 0,'
+            ' owner INTEGER,'
+            ' error TEXT)')
+        self.requeue_orphans()
+
+    def requeue_orphans(self) -> int:
+        """
+        Queue again the active jobs whose owning process is not running.
+
+        Returns:
+            int: The number of jobs queued again.
+        """
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT DISTINCT owner FROM jobs WHERE status = ?',
+                (ACTIVE,)).fetchall()
+            count = 0
+            for row in rows:
+                if row['owner'] is not None and \
+                        process_alive(row['owner']):
+                    continue
+                count += self.db.execute(
+                    'UPDATE jobs SET status = ?, owner = NULL'
+                    ' WHERE status = ? AND owner IS ?',
+                    (QUEUED, ACTIVE, row['owner'])).rowcount
+            return count
+
+    def enqueue(self, name: str, data: Dict[str, Any],
+                max_attempts: int = 1) -> int:
+        """
+        Add a job to the queue.
+
+        Args:
+            name (str): The name of the handler that processes the job.
+            data (dict): The JSON serializable arguments of the job.
+            max_attempts (int): Number of times the job may be started.
+
+        Returns:
+            int: The identifier of the new job.
+        """
+        assert isinstance(max_attempts, int) and max_attempts > 0
+        with self.lock:
+            cursor = self.db.execute(
+                'INSERT INTO jobs (name, data, status, max_attempts)'
+                ' VALUES (?, ?, ?, ?)',
+                (name, json.dumps(data), QUEUED, max_attempts))
+            return cursor.lastrowid
+
+    def claim(self) -> Optional[Job]:
+        """
+        Mark the oldest queued job as active and return it. The job is
+        taken with a conditional UPDATE, so when another process claims
+        it first the next queued job is tried instead. The Job is built
+        from the row read before the UPDATE, so once the claim succeeds
+        no further database access can fail and strand it as active.
+
+        Returns:
+            Job: The claimed job, or None if no job is queued.
+        """
+        with self.lock:
+            while True:
+                row = self.db.execute(
+                    'SELECT * FROM jobs WHERE status = ?'
+                    ' ORDER BY id LIMIT 1', (QUEUED,)).fetchone()
+                if row is None:
+                    return None
+                claimed = self.db.execute(
+                    'UPDATE jobs SET status = ?, owner = ?,'
+                    ' attempts = attempts + 1'
+                    ' WHERE id = ? AND status = ?',
+                    (ACTIVE, os.getpid(), row['id'], QUEUED)).rowcount
+                if claimed:
+                    job = Job(self, row)
+                    job.status = ACTIVE
+                    job.attempts += 1
+                    return job
+
+    def set_progress(self, job_id: int, progress: int) -> None:
+        """
+        Record the completion percentage of a job.
+        """
+        with self.lock:
+            self.db.execute('UPDATE jobs SET progress = ? WHERE id = ?',
+                            (progress, job_id))
+
+    def complete(self, job_id: int) -> None:
+        """
+        Mark a job as complete.
+        """
+        with self.lock:
+            self.db.execute(
+                'UPDATE jobs SET status = ?, progress = 100 WHERE id = ?',
+                (COMPLETE, job_id))
+
+    def fail(self, job_id: int, error: str) -> str:
+        """
+        Record a failed attempt, queueing the job again if it has
+        attempts left.
+
+        Args:
+            job_id (int): The job that failed.
+            error (str): Description of the failure.
+
+        Returns:
+            str: The job's new status, queued or failed.
+        """
+        with self.lock:
+            self.db.execute(
+                'UPDATE jobs SET error = ?, owner = NULL, status = CASE'
+                ' WHEN attempts < max_attempts THEN ? ELSE ? END'
+                ' WHERE id = ?', (error, QUEUED, FAILED, job_id))
+            return self.__get(job_id).status
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """
+        Return the job with the given identifier, or None.
+        """
+        with self.lock:
+            return self.__get(job_id)
+
+    def jobs(self) -> List[Job]:
+        """
+        Return every job in the order they were queued.
+        """
+        with self.lock:
+            rows = self.db.execute('SELECT * FROM jobs ORDER BY id')
+            return [Job(self, row) for row in rows.fetchall()]
+
+    def __get(self, job_id: int) -> Optional[Job]:
+        """
+        Return the job with the given identifier; the lock must be held.
+        """
+        row = self.db.execute('SELECT * FROM jobs WHERE id = ?',
+                              (job_id,)).fetchone()
+        return None if row is None else Job(self, row)
+
+
+class JobQueue:
+    """
+    In-process worker pool processing the jobs of a broker.
+
+    Handlers are registered by name and called with the claimed Job; a
+    handler that raises fails the attempt and the job is retried while it
+    has attempts left.
+    """
+
+    def __init__(self, broker: SQLiteBroker, concurrency: int = 2,
+                 poll_interval: float = 0.1):
+        """
+        Initialize a stopped queue.
+
+        Args:
+            broker (SQLiteBroker): Where jobs are stored.
+            concurrency (int): Maximum number of jobs processed at once.
+            poll_interval (float): Seconds an idle worker waits before
+                looking for new jobs.
+        """
+        assert isinstance(concurrency, int) and concurrency > 0
+        self.broker = broker
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.handlers: Dict[str, Callable[[Job], None]] = {}
+        self.workers: List[threading.Thread] = []
+        self.stopping = threading.Event()
+
+    def register(self, name: str, handler: Callable[[Job], None]) -> None:
+        """
+        Register the handler processing jobs of the given name.
+        """
+        self.handlers[name] = handler
+
+    def enqueue(self, name: str, data: Optional[Dict[str, Any]] = None,
+                attempts: int = 1) -> int:
+        """
+        Queue a job for a registered handler.
+
+        Args:
+            name (str): The name of the handler.
+            data (dict): The JSON serializable arguments of the job.
+            attempts (int): Number of times the job may be started.
+
+        Returns:
+            int: The identifier of the new job.
+        """
+        if name not in self.handlers:
+            raise KeyError("no handler registered for job '{}'".format(name))
+        return self.broker.enqueue(name, data or {}, attempts)
+
+    def record(self, call: Callable, *args) -> Any:
+        """
+        Call a broker method recording a job's outcome, retrying every
+        poll_interval while the database is locked by another process:
+        giving up would leave the job active under this live process,
+        where no broker would ever take it back.
+
+        Args:
+            call (Callable): The broker method to call.
+            *args: Its arguments.
+
+        Returns:
+            Any: What the broker method returns.
+        """
+        while True:
+            try:
+                return call(*args)
+            except sqlite3.OperationalError:
+                time.sleep(self.poll_interval)
+
+    def process(self, job: Job) -> None:
+        """
+        Run a claimed job and record its outcome in the broker.
+        """
+        try:
+            self.handlers[job.name](job)
+        except Exception:
+            status = self.record(self.broker.fail, job.id,
+                                 traceback.format_exc())
+            print("Job {} {}: {} (attempt {}/{})".format(
+                job.id, status, job.name, job.attempts, job.max_attempts))
+        else:
+            self.record(self.broker.complete, job.id)
+
+    def work(self, until_empty: bool) -> None:
+        """
+        Worker loop: claim and process jobs until the queue is stopped,
+        or until no job is queued when until_empty is set. A claim the
+        locked database refuses is retried after poll_interval.
+        """
+        while not self.stopping.is_set():
+            try:
+                job = self.broker.claim()
+            except sqlite3.OperationalError:
+                self.stopping.wait(self.poll_interval)
+                continue
+            if job is not None:
+                self.process(job)
+            elif until_empty:
+                return
+            else:
+                self.stopping.wait(self.poll_interval)
+
+    def start(self, until_empty: bool = False) -> None:
+        """
+        Start the worker threads.
+
+        Args:
+            until_empty (bool): Let the workers exit once no job is
+                queued instead of waiting for new ones.
+
+        Raises:
+            RuntimeError: If workers of a previous start are still
+                running, which would exceed the concurrency bound.
+        """
+        if any(worker.is_alive() for worker in self.workers):
+            raise RuntimeError("job queue workers are already running")
+        self.stopping.clear()
+        self.workers = [
+            threading.Thread(target=self.work, args=(until_empty,),
+                             daemon=True)
+            for _ in range(self.concurrency)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def stop(self) -> None:
+        """
+        Ask the workers to exit after their current job and wait for them.
+        """
+        self.stopping.set()
+        self.join()
+
+    def join(self) -> None:
+        """
+        Wait for the worker threads to exit.
+        """
+        for worker in self.workers:
+            worker.join()
+
+    def drain(self) -> None:
+        """
+        Process every queued job, including retries, then return.
+        """
+        self.start(until_empty=True)
+        self.join()